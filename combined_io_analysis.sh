@@ -142,15 +142,23 @@ analyze_strace_quick() {
         return
     fi
     
-    # Count syscalls
-    local open_count=$(grep -c "open\|openat" $strace_file 2>/dev/null || echo 0)
-    local read_count=$(grep -c "read(" $strace_file 2>/dev/null || echo 0)
-    local write_count=$(grep -c "write(" $strace_file 2>/dev/null || echo 0)
-    local pread_count=$(grep -c "pread64" $strace_file 2>/dev/null || echo 0)
-    local pwrite_count=$(grep -c "pwrite64" $strace_file 2>/dev/null || echo 0)
-    local fsync_count=$(grep -c "fsync\|fdatasync" $strace_file 2>/dev/null || echo 0)
-    local xlmeta_count=$(grep -c "xl.meta" $strace_file 2>/dev/null || echo 0)
-    local part_count=$(grep -c "/part\." $strace_file 2>/dev/null || echo 0)
+    # Count syscalls and object file accesses in a single pass
+    local open_count read_count write_count pread_count pwrite_count fsync_count
+    local xlmeta_count part_count
+    read -r open_count read_count write_count pread_count pwrite_count fsync_count \
+            xlmeta_count part_count < <(awk '
+        /open/ { opens++ }
+        /read\(/ { reads++ }
+        /write\(/ { writes++ }
+        /pread64/ { preads++ }
+        /pwrite64/ { pwrites++ }
+        /fsync|fdatasync/ { syncs++ }
+        /xl.meta/ { metas++ }
+        /\/part\./ { parts++ }
+        END {
+            print opens+0, reads+0, writes+0, preads+0, pwrites+0, syncs+0,
+                  metas+0, parts+0
+        }' $strace_file 2>/dev/null)
     
     echo "    Open/openat: $open_count | Read: $read_count | Write: $write_count"
     echo "    Pread64: $pread_count | Pwrite64: $pwrite_count | Fsync: $fsync_count"
@@ -169,7 +177,13 @@ analyze_combined_data() {
     python3 - << EOF
 import re
 import sys
-from collections import defaultdict
+from collections import Counter
+
+# Syscall return-value patterns, compiled once for the strace pass
+READ_RE = re.compile(r'read\([^)]+\)\s*=\s*(\d+)')
+WRITE_RE = re.compile(r'write\([^)]+\)\s*=\s*(\d+)')
+PREAD64_RE = re.compile(r'pread64\([^)]+\)\s*=\s*(\d+)')
+PWRITE64_RE = re.compile(r'pwrite64\([^)]+\)\s*=\s*(\d+)')
 
 size = $size
 name = "$name"
@@ -203,7 +217,9 @@ ebpf_stats = {
 try:
     with open(ebpf_file, 'r') as f:
         for line in f:
-            if 'TIME' in line or '===' in line:
+            # Event rows start with their HH:MM:SS timestamp; one character
+            # test drops the header, separators and end-of-run summaries
+            if not line[:1].isdigit():
                 continue
                 
             parts = line.split()
@@ -291,9 +307,14 @@ print("")
 print("STRACE SYSCALL ANALYSIS")
 print("-" * 40)
 
-syscall_stats = defaultdict(lambda: {'count': 0, 'bytes': 0})
-xl_meta_ops = []
-part_file_ops = []
+# Per-syscall call counts and byte totals; missing keys read as 0
+call_counts = Counter()
+byte_counts = Counter()
+# Only counts are reported, plus the lines themselves when there are
+# just a few xl.meta operations, so keep at most three samples
+xl_meta_count = 0
+xl_meta_samples = []
+part_file_count = 0
 
 try:
     with open(strace_file, 'r') as f:
@@ -302,73 +323,75 @@ try:
             
             # Handle read syscalls
             if 'read(' in line:
-                match = re.search(r'read\([^)]+\)\s*=\s*(\d+)', line)
+                match = READ_RE.search(line)
                 if match:
                     bytes_read = int(match.group(1))
-                    syscall_stats['read']['count'] += 1
-                    syscall_stats['read']['bytes'] += bytes_read
+                    call_counts['read'] += 1
+                    byte_counts['read'] += bytes_read
             
             # Handle write syscalls
             elif 'write(' in line:
-                match = re.search(r'write\([^)]+\)\s*=\s*(\d+)', line)
+                match = WRITE_RE.search(line)
                 if match:
                     bytes_written = int(match.group(1))
-                    syscall_stats['write']['count'] += 1
-                    syscall_stats['write']['bytes'] += bytes_written
+                    call_counts['write'] += 1
+                    byte_counts['write'] += bytes_written
             
             # Handle pread64
             elif 'pread64(' in line:
-                match = re.search(r'pread64\([^)]+\)\s*=\s*(\d+)', line)
+                match = PREAD64_RE.search(line)
                 if match:
                     bytes_read = int(match.group(1))
-                    syscall_stats['pread64']['count'] += 1
-                    syscall_stats['pread64']['bytes'] += bytes_read
+                    call_counts['pread64'] += 1
+                    byte_counts['pread64'] += bytes_read
             
             # Handle pwrite64
             elif 'pwrite64(' in line:
-                match = re.search(r'pwrite64\([^)]+\)\s*=\s*(\d+)', line)
+                match = PWRITE64_RE.search(line)
                 if match:
                     bytes_written = int(match.group(1))
-                    syscall_stats['pwrite64']['count'] += 1
-                    syscall_stats['pwrite64']['bytes'] += bytes_written
+                    call_counts['pwrite64'] += 1
+                    byte_counts['pwrite64'] += bytes_written
             
             # Count other syscalls
             elif 'open(' in line or 'openat(' in line:
-                syscall_stats['open']['count'] += 1
+                call_counts['open'] += 1
             elif 'fsync(' in line:
-                syscall_stats['fsync']['count'] += 1
+                call_counts['fsync'] += 1
             elif 'fdatasync(' in line:
-                syscall_stats['fdatasync']['count'] += 1
+                call_counts['fdatasync'] += 1
             elif 'lseek(' in line:
-                syscall_stats['lseek']['count'] += 1
+                call_counts['lseek'] += 1
             elif 'stat(' in line or 'fstat(' in line:
-                syscall_stats['stat']['count'] += 1
+                call_counts['stat'] += 1
             
             # Track xl.meta and part file operations
             if 'xl.meta' in line:
-                xl_meta_ops.append(line.strip())
+                xl_meta_count += 1
+                if len(xl_meta_samples) < 3:
+                    xl_meta_samples.append(line.strip())
             if '/part.' in line:
-                part_file_ops.append(line.strip())
+                part_file_count += 1
                 
 except FileNotFoundError:
     print("  Strace file not found")
 
 # Calculate totals
-total_read_bytes = syscall_stats['read']['bytes'] + syscall_stats['pread64']['bytes']
-total_write_bytes = syscall_stats['write']['bytes'] + syscall_stats['pwrite64']['bytes']
-total_read_ops = syscall_stats['read']['count'] + syscall_stats['pread64']['count']
-total_write_ops = syscall_stats['write']['count'] + syscall_stats['pwrite64']['count']
+total_read_bytes = byte_counts['read'] + byte_counts['pread64']
+total_write_bytes = byte_counts['write'] + byte_counts['pwrite64']
+total_read_ops = call_counts['read'] + call_counts['pread64']
+total_write_ops = call_counts['write'] + call_counts['pwrite64']
 
 print(f"Syscall Summary:")
-print(f"  • read():     {syscall_stats['read']['count']:>4} calls, {syscall_stats['read']['bytes']:>10,} bytes")
-print(f"  • write():    {syscall_stats['write']['count']:>4} calls, {syscall_stats['write']['bytes']:>10,} bytes")
-print(f"  • pread64():  {syscall_stats['pread64']['count']:>4} calls, {syscall_stats['pread64']['bytes']:>10,} bytes")
-print(f"  • pwrite64(): {syscall_stats['pwrite64']['count']:>4} calls, {syscall_stats['pwrite64']['bytes']:>10,} bytes")
-print(f"  • open/at():  {syscall_stats['open']['count']:>4} calls")
-print(f"  • fsync():    {syscall_stats['fsync']['count']:>4} calls")
-print(f"  • fdatasync():{syscall_stats['fdatasync']['count']:>4} calls")
-print(f"  • lseek():    {syscall_stats['lseek']['count']:>4} calls")
-print(f"  • stat/fstat():{syscall_stats['stat']['count']:>4} calls")
+print(f"  • read():     {call_counts['read']:>4} calls, {byte_counts['read']:>10,} bytes")
+print(f"  • write():    {call_counts['write']:>4} calls, {byte_counts['write']:>10,} bytes")
+print(f"  • pread64():  {call_counts['pread64']:>4} calls, {byte_counts['pread64']:>10,} bytes")
+print(f"  • pwrite64(): {call_counts['pwrite64']:>4} calls, {byte_counts['pwrite64']:>10,} bytes")
+print(f"  • open/at():  {call_counts['open']:>4} calls")
+print(f"  • fsync():    {call_counts['fsync']:>4} calls")
+print(f"  • fdatasync():{call_counts['fdatasync']:>4} calls")
+print(f"  • lseek():    {call_counts['lseek']:>4} calls")
+print(f"  • stat/fstat():{call_counts['stat']:>4} calls")
 print("")
 
 print(f"I/O Totals from Syscalls:")
@@ -381,12 +404,12 @@ else:
 print("")
 
 print(f"MinIO Metadata Operations:")
-print(f"  • xl.meta accesses: {len(xl_meta_ops)}")
-print(f"  • part. file operations: {len(part_file_ops)}")
+print(f"  • xl.meta accesses: {xl_meta_count}")
+print(f"  • part. file operations: {part_file_count}")
 
-if xl_meta_ops and len(xl_meta_ops) <= 3:
+if xl_meta_samples and xl_meta_count <= 3:
     print(f"\n  Sample xl.meta operations:")
-    for op in xl_meta_ops[:3]:
+    for op in xl_meta_samples:
         print(f"    {op[:100]}...")
 print("")
 
@@ -418,14 +441,13 @@ print("")
 print(f"Final I/O Amplification Factors:")
 print(f"  • Application → OS: {ebpf_stats['os_bytes']/size if ebpf_stats['os_bytes'] > 0 else 0:.1f}x")
 print(f"  • Application → Device: {ebpf_stats['device_bytes']/size if ebpf_stats['device_bytes'] > 0 else 0:.1f}x")
-print(f"  • Metadata overhead: {len(xl_meta_ops)} xl.meta operations")
+print(f"  • Metadata overhead: {xl_meta_count} xl.meta operations")
 print("")
 EOF
 
     # Save analysis to file
     python3 - << EOF > $analysis_file
 # Re-run the same analysis but save to file
-import re
 from collections import defaultdict
 
 size = $size
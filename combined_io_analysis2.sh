@@ -132,7 +132,13 @@ analyze_io_data() {
     
     python3 - << EOF
 import re
-from collections import defaultdict
+from collections import Counter
+
+# Syscall return-value patterns, compiled once for the strace pass
+READ_RE = re.compile(r'read\([^)]+\)\s*=\s*(\d+)')
+WRITE_RE = re.compile(r'write\([^)]+\)\s*=\s*(\d+)')
+PREAD64_RE = re.compile(r'pread64\([^)]+\)\s*=\s*(\d+)')
+PWRITE64_RE = re.compile(r'pwrite64\([^)]+\)\s*=\s*(\d+)')
 
 size = $size
 name = "$name"
@@ -168,10 +174,11 @@ end_marker = None
 try:
     with open(ebpf_file + '.markers', 'r') as f:
         for line in f:
+            # 'NAME: value' lines; float() ignores the surrounding whitespace
             if 'START_MARKER' in line:
-                start_marker = float(line.split(':')[1].strip())
+                start_marker = float(line.partition(':')[2])
             elif 'END_MARKER' in line:
-                end_marker = float(line.split(':')[1].strip())
+                end_marker = float(line.partition(':')[2])
 except:
     pass
 
@@ -179,8 +186,8 @@ except:
 try:
     with open(ebpf_file, 'r') as f:
         for line in f:
-            # Skip headers and empty lines
-            if 'TIME' in line or '===' in line or not line.strip():
+            # Skip headers; empty lines fall to the field-count check below
+            if 'TIME' in line or '===' in line:
                 continue
             
             # Parse line - adjust based on actual format
@@ -194,12 +201,9 @@ try:
                 layer = parts[1] if len(parts) > 1 else ""
                 event = parts[2] if len(parts) > 2 else ""
                 
-                # Try to parse size - it might be in different positions
-                size_val = 0
-                for i in range(3, min(6, len(parts))):
-                    if parts[i].isdigit():
-                        size_val = int(parts[i])
-                        break
+                # Try to parse size - it might be in different positions;
+                # first all-digit token among fields 3-5, without index math
+                size_val = next((int(tok) for tok in parts[3:6] if tok.isdigit()), 0)
                 
                 # Count operations based on layer
                 if 'APPLICATION' in layer:
@@ -255,7 +259,9 @@ print("")
 print("STRACE SYSCALL ANALYSIS")
 print("-" * 40)
 
-syscall_stats = defaultdict(lambda: {'count': 0, 'bytes': 0})
+# Per-syscall call counts and byte totals; missing keys read as 0
+call_counts = Counter()
+byte_counts = Counter()
 xl_meta_count = 0
 part_file_count = 0
 
@@ -270,35 +276,35 @@ try:
             
             # Parse syscalls
             if 'read(' in line:
-                match = re.search(r'read\([^)]+\)\s*=\s*(\d+)', line)
+                match = READ_RE.search(line)
                 if match:
                     bytes_read = int(match.group(1))
-                    syscall_stats['read']['count'] += 1
-                    syscall_stats['read']['bytes'] += bytes_read
+                    call_counts['read'] += 1
+                    byte_counts['read'] += bytes_read
                     
             elif 'write(' in line:
-                match = re.search(r'write\([^)]+\)\s*=\s*(\d+)', line)
+                match = WRITE_RE.search(line)
                 if match:
                     bytes_written = int(match.group(1))
-                    syscall_stats['write']['count'] += 1
-                    syscall_stats['write']['bytes'] += bytes_written
+                    call_counts['write'] += 1
+                    byte_counts['write'] += bytes_written
                     
             elif 'pread64(' in line:
-                match = re.search(r'pread64\([^)]+\)\s*=\s*(\d+)', line)
+                match = PREAD64_RE.search(line)
                 if match:
                     bytes_read = int(match.group(1))
-                    syscall_stats['pread64']['count'] += 1
-                    syscall_stats['pread64']['bytes'] += bytes_read
+                    call_counts['pread64'] += 1
+                    byte_counts['pread64'] += bytes_read
                     
             elif 'pwrite64(' in line:
-                match = re.search(r'pwrite64\([^)]+\)\s*=\s*(\d+)', line)
+                match = PWRITE64_RE.search(line)
                 if match:
                     bytes_written = int(match.group(1))
-                    syscall_stats['pwrite64']['count'] += 1
-                    syscall_stats['pwrite64']['bytes'] += bytes_written
+                    call_counts['pwrite64'] += 1
+                    byte_counts['pwrite64'] += bytes_written
                     
             elif 'fsync(' in line or 'fdatasync(' in line:
-                syscall_stats['sync']['count'] += 1
+                call_counts['sync'] += 1
                 
 except FileNotFoundError:
     print("  Strace file not found")
@@ -306,15 +312,15 @@ except Exception as e:
     print(f"  Error parsing strace: {e}")
 
 # Calculate totals
-total_read_bytes = syscall_stats['read']['bytes'] + syscall_stats['pread64']['bytes']
-total_write_bytes = syscall_stats['write']['bytes'] + syscall_stats['pwrite64']['bytes']
+total_read_bytes = byte_counts['read'] + byte_counts['pread64']
+total_write_bytes = byte_counts['write'] + byte_counts['pwrite64']
 
 print(f"Syscalls:")
-print(f"  • read: {syscall_stats['read']['count']} calls, {syscall_stats['read']['bytes']:,} bytes")
-print(f"  • write: {syscall_stats['write']['count']} calls, {syscall_stats['write']['bytes']:,} bytes")
-print(f"  • pread64: {syscall_stats['pread64']['count']} calls, {syscall_stats['pread64']['bytes']:,} bytes")
-print(f"  • pwrite64: {syscall_stats['pwrite64']['count']} calls, {syscall_stats['pwrite64']['bytes']:,} bytes")
-print(f"  • sync operations: {syscall_stats['sync']['count']}")
+print(f"  • read: {call_counts['read']} calls, {byte_counts['read']:,} bytes")
+print(f"  • write: {call_counts['write']} calls, {byte_counts['write']:,} bytes")
+print(f"  • pread64: {call_counts['pread64']} calls, {byte_counts['pread64']:,} bytes")
+print(f"  • pwrite64: {call_counts['pwrite64']} calls, {byte_counts['pwrite64']:,} bytes")
+print(f"  • sync operations: {call_counts['sync']}")
 print("")
 
 print(f"MinIO Metadata:")
@@ -397,20 +403,23 @@ echo ""
 echo "Generating summary CSV..."
 echo "Size,Operation,App_Bytes,OS_Bytes,Device_Bytes,Syscall_Bytes,XL_Meta,OS_Amp,Device_Amp" > $RESULTS_DIR/summary.csv
 
-# Collect results from JSON files
-for i in ${!SIZES[@]}; do
-    for op in write read; do
-        json_file="$RESULTS_DIR/ebpf_traces/$op/${NAMES[$i]}_${op}.ebpf.json"
-        if [ -f "$json_file" ]; then
-            python3 -c "
+# Collect results from the JSON files in one interpreter
+python3 - << EOF >> $RESULTS_DIR/summary.csv
 import json
-with open('$json_file', 'r') as f:
-    data = json.load(f)
-    print(f\"{data['size']},{data['operation']},{data['app_bytes']},{data['os_bytes']},{data['device_bytes']},{data['syscall_bytes']},{data['xl_meta']},{data['os_amp']:.1f},{data['device_amp']:.1f}\")
-" >> $RESULTS_DIR/summary.csv
-        fi
-    done
-done
+import os
+
+results_dir = "$RESULTS_DIR"
+names = "${NAMES[*]}".split()
+
+for name in names:
+    for op in ('write', 'read'):
+        json_file = os.path.join(results_dir, 'ebpf_traces', op, f"{name}_{op}.ebpf.json")
+        if not os.path.isfile(json_file):
+            continue
+        with open(json_file, 'r') as f:
+            data = json.load(f)
+        print(f"{data['size']},{data['operation']},{data['app_bytes']},{data['os_bytes']},{data['device_bytes']},{data['syscall_bytes']},{data['xl_meta']},{data['os_amp']:.1f},{data['device_amp']:.1f}")
+EOF
 
 # Display summary
 echo ""
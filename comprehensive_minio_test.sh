@@ -35,22 +35,23 @@ analyze_log() {
     
     echo "Analyzing $name..."
     
-    # Count different types of operations
-    local total_lines=$(wc -l < $logfile)
-    local app_puts=$(grep -c "APPLICATION.*MINIO_OBJECT_PUT" $logfile || echo 0)
-    local app_gets=$(grep -c "APPLICATION.*MINIO_OBJECT_GET" $logfile || echo 0)
-    local metadata_ops=$(grep -c "MINIO_XL_META" $logfile || echo 0)
-    local fs_syncs=$(grep -c "FS_SYNC" $logfile || echo 0)
-    local bio_submits=$(grep -c "DEV_BIO_SUBMIT" $logfile || echo 0)
-    local bio_completes=$(grep -c "DEV_BIO_COMPLETE" $logfile || echo 0)
-    
-    # Calculate I/O sizes
-    local data_io=$(grep "MINIO_OBJECT_PUT\|MINIO_OBJECT_GET" $logfile | \
-                    awk '{sum+=$4} END {print sum}' || echo 0)
-    local os_io=$(grep "OS_VFS" $logfile | \
-                  awk '{sum+=$5} END {print sum}' || echo 0)
-    local device_io=$(grep "DEV_BIO_SUBMIT" $logfile | \
-                      awk '{sum+=$4} END {print sum}' || echo 0)
+    # Count operations, sum I/O sizes and device latency in a single pass
+    local total_lines app_puts app_gets metadata_ops fs_syncs bio_submits bio_completes
+    local data_io os_io device_io avg_latency
+    read -r total_lines app_puts app_gets metadata_ops fs_syncs bio_submits bio_completes \
+            data_io os_io device_io avg_latency < <(awk '
+        /APPLICATION.*MINIO_OBJECT_PUT/ { puts++ }
+        /APPLICATION.*MINIO_OBJECT_GET/ { gets++ }
+        /MINIO_XL_META/ { meta++ }
+        /FS_SYNC/ { syncs++ }
+        /MINIO_OBJECT_PUT|MINIO_OBJECT_GET/ { data += $4 }
+        /OS_VFS/ { os += $5 }
+        /DEV_BIO_SUBMIT/ { submits++; dev += $4 }
+        /DEV_BIO_COMPLETE/ { completes++; lat += $6 }
+        END {
+            print NR, puts+0, gets+0, meta+0, syncs+0, submits+0, completes+0,
+                  data+0, os+0, dev+0, (completes > 0 ? lat/completes : 0)
+        }' $logfile)
     
     # Calculate amplification
     local amplification=0
@@ -58,10 +59,6 @@ analyze_log() {
         amplification=$(echo "scale=2; $device_io / $size" | bc)
     fi
     
-    # Extract latency information
-    local avg_latency=$(grep "DEV_BIO_COMPLETE" $logfile | \
-                        awk '{sum+=$6; count++} END {if(count>0) print sum/count; else print 0}')
-    
     # Save analysis results
     cat > "$RESULTS_DIR/${name}_analysis.txt" << EOF
 ================================================================================
@@ -120,8 +120,6 @@ sleep 1
 # Analyze captured data
 echo "Full trace analysis:"
 python3 - << EOF
-import re
-
 trace_file = "$RESULTS_DIR/full_trace.log"
 start_time = $START_MARKER
 end_time = $END_MARKER
@@ -150,7 +148,11 @@ try:
             try:
                 layer = parts[1] if len(parts) > 1 else ""
                 event = parts[2] if len(parts) > 2 else ""
-                size_val = int(parts[3]) if len(parts) > 3 and parts[3].isdigit() else 0
+                # One conversion; non-numeric size fields count as 0
+                try:
+                    size_val = int(parts[3])
+                except ValueError:
+                    size_val = 0
                 
                 if 'APPLICATION' in layer:
                     stats['app']['count'] += 1
@@ -5,11 +5,37 @@ Complete I/O analysis reading from both eBPF and strace result directories
 Shows full I/O path: Application → Syscalls → Filesystem → Device
 """
 
+import os
 import sys
 import re
+import mmap
+import fnmatch
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from collections import defaultdict
 
+# Aggregate-statistics patterns in eBPF trace summaries (matched on bytes)
+_APP_LAYER_RE = re.compile(rb'Application layer:\s+(\d+)\s+bytes')
+_OS_LAYER_RE = re.compile(rb'OS layer:\s+(\d+)\s+bytes')
+_DEVICE_LAYER_RE = re.compile(rb'Device layer:\s+(\d+)\s+bytes')
+_TOTAL_AMP_RE = re.compile(rb'TOTAL AMPLIFICATION:\s+([\d.]+)x')
+
+# (metric, pattern, converter) for each aggregate-statistics line
+_SUMMARY_FIELDS = (
+    ('app_bytes', _APP_LAYER_RE, int),
+    ('os_bytes', _OS_LAYER_RE, int),
+    ('device_bytes', _DEVICE_LAYER_RE, int),
+    ('amplification', _TOTAL_AMP_RE, float),
+)
+
+# open/openat result descriptor and the first quoted path in an strace line
+_OPEN_FD_RE = re.compile(r'= (\d+)')
+_QUOTED_PATH_RE = re.compile(r'"([^"]+)"')
+
+# read/write-family call with its fd and returned byte count; pread64 and
+# pwrite64 are listed first so they win at the same starting position
+_IO_SYSCALL_RE = re.compile(r'(pread64|pwrite64|read|write)\((\d+),.*?\)\s*=\s*(\d+)')
+
 def parse_ebpf_trace(filepath):
     """Parse eBPF trace file for metrics"""
     metrics = {
@@ -20,30 +46,20 @@ def parse_ebpf_trace(filepath):
     }
     
     try:
-        with open(filepath, 'r') as f:
-            content = f.read()
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return metrics
             
-            # Look for aggregate statistics section
-            if 'AGGREGATE STATISTICS' in content or 'Application layer:' in content:
-                # Extract application bytes
-                app_match = re.search(r'Application layer:\s+(\d+)\s+bytes', content)
-                if app_match:
-                    metrics['app_bytes'] = int(app_match.group(1))
-                
-                # Extract OS bytes
-                os_match = re.search(r'OS layer:\s+(\d+)\s+bytes', content)
-                if os_match:
-                    metrics['os_bytes'] = int(os_match.group(1))
-                
-                # Extract device bytes
-                device_match = re.search(r'Device layer:\s+(\d+)\s+bytes', content)
-                if device_match:
-                    metrics['device_bytes'] = int(device_match.group(1))
-                
-                # Extract amplification
-                amp_match = re.search(r'TOTAL AMPLIFICATION:\s+([\d.]+)x', content)
-                if amp_match:
-                    metrics['amplification'] = float(amp_match.group(1))
+            # Map the trace instead of reading it; the summary is a few lines
+            # at the end of what can be a very large event log, and find()
+            # and the patterns scan the mapping without per-line copies
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Look for aggregate statistics section
+                if mm.find(b'AGGREGATE STATISTICS') >= 0 or mm.find(b'Application layer:') >= 0:
+                    for key, pattern, convert in _SUMMARY_FIELDS:
+                        match = pattern.search(mm)
+                        if match:
+                            metrics[key] = convert(match.group(1))
     except Exception as e:
         print(f"Error parsing eBPF file {filepath}: {e}", file=sys.stderr)
     
@@ -51,80 +67,157 @@ def parse_ebpf_trace(filepath):
 
 def parse_strace_file(filepath):
     """Parse strace file for syscall metrics"""
-    metrics = {
-        'syscall_writes': 0,
-        'syscall_reads': 0,
-        'xl_meta_ops': 0,
-        'part_files': 0,
-        'write_calls': 0,
-        'read_calls': 0,
-        'pwrite_calls': 0,
-        'pread_calls': 0,
-        'files_accessed': set(),
-        'fd_to_file': {}
-    }
+    # Fixed set of counters kept in locals while scanning, packed into the
+    # metrics dict once at the end
+    write_bytes = write_calls = pwrite_bytes = pwrite_calls = 0
+    read_bytes = read_calls = pread_bytes = pread_calls = 0
+    xl_meta_ops = part_files = 0
+    # One entry per distinct path: (shared path string, is xl.meta, is a
+    # part file). Repeat opens reuse the string and skip the substring
+    # tests, and the keys double as the set of files accessed
+    path_kinds = {}
+    fd_to_file = {}
     
     try:
-        with open(filepath, 'r') as f:
+        # 1 MiB buffer: captures run to hundreds of MB, so fewer read() calls
+        with open(filepath, 'r', buffering=1 << 20) as f:
             for line in f:
+                # Both tracked kinds are completed calls with a "= <ret>"
+                # result; unfinished, signal and exit lines stop here
+                if '= ' not in line:
+                    continue
+                
                 # Track file opens
                 if 'openat(' in line or 'open(' in line:
-                    fd_match = re.search(r'= (\d+)', line)
-                    path_match = re.search(r'"([^"]+)"', line)
+                    fd_match = _OPEN_FD_RE.search(line)
+                    path_match = _QUOTED_PATH_RE.search(line)
                     
                     if fd_match and path_match:
                         fd_val = int(fd_match.group(1))
                         if fd_val >= 0:
                             fd = str(fd_val)
                             path = path_match.group(1)
-                            metrics['fd_to_file'][fd] = path
-                            metrics['files_accessed'].add(path)
+                            kind = path_kinds.get(path)
+                            if kind is None:
+                                kind = path_kinds[path] = (
+                                    path, 'xl.meta' in path,
+                                    '/part.' in path or 'part-' in path)
+                            path, is_xl_meta, is_part = kind
+                            fd_to_file[fd] = path
                             
-                            if 'xl.meta' in path:
-                                metrics['xl_meta_ops'] += 1
-                            if '/part.' in path or 'part-' in path:
-                                metrics['part_files'] += 1
+                            if is_xl_meta:
+                                xl_meta_ops += 1
+                            if is_part:
+                                part_files += 1
                 
-                # Parse write syscalls
-                if 'write(' in line and '= ' in line:
-                    match = re.search(r'write\((\d+),.*?\)\s*=\s*(\d+)', line)
+                # Parse read/write/pread64/pwrite64 with one pattern and
+                # dispatch on the syscall name it matched
+                if 'read' in line or 'write' in line:
+                    match = _IO_SYSCALL_RE.search(line)
                     if match:
-                        bytes_written = int(match.group(2))
-                        if bytes_written > 0:
-                            metrics['syscall_writes'] += bytes_written
-                            metrics['write_calls'] += 1
-                
-                # Parse pwrite64 syscalls
-                if 'pwrite64(' in line and '= ' in line:
-                    match = re.search(r'pwrite64\((\d+),.*?\)\s*=\s*(\d+)', line)
-                    if match:
-                        bytes_written = int(match.group(2))
-                        if bytes_written > 0:
-                            metrics['syscall_writes'] += bytes_written
-                            metrics['pwrite_calls'] += 1
-                
-                # Parse read syscalls
-                if 'read(' in line and '= ' in line and 'bread' not in line:
-                    match = re.search(r'read\((\d+),.*?\)\s*=\s*(\d+)', line)
-                    if match:
-                        bytes_read = int(match.group(2))
-                        if bytes_read > 0:
-                            metrics['syscall_reads'] += bytes_read
-                            metrics['read_calls'] += 1
-                
-                # Parse pread64 syscalls
-                if 'pread64(' in line and '= ' in line:
-                    match = re.search(r'pread64\((\d+),.*?\)\s*=\s*(\d+)', line)
-                    if match:
-                        bytes_read = int(match.group(2))
-                        if bytes_read > 0:
-                            metrics['syscall_reads'] += bytes_read
-                            metrics['pread_calls'] += 1
+                        name = match.group(1)
+                        nbytes = int(match.group(3))
+                        if nbytes <= 0:
+                            continue
+                        if name == 'write':
+                            write_bytes += nbytes
+                            write_calls += 1
+                        elif name == 'read':
+                            if 'bread' not in line:
+                                read_bytes += nbytes
+                                read_calls += 1
+                        elif name == 'pwrite64':
+                            pwrite_bytes += nbytes
+                            pwrite_calls += 1
+                        else:
+                            pread_bytes += nbytes
+                            pread_calls += 1
                             
     except Exception as e:
         print(f"Error parsing strace file {filepath}: {e}", file=sys.stderr)
     
-    return metrics
+    return {
+        'syscall_writes': write_bytes + pwrite_bytes,
+        'syscall_reads': read_bytes + pread_bytes,
+        'xl_meta_ops': xl_meta_ops,
+        'part_files': part_files,
+        'write_calls': write_calls,
+        'read_calls': read_calls,
+        'pwrite_calls': pwrite_calls,
+        'pread_calls': pread_calls,
+        'files_accessed': set(path_kinds),
+        'fd_to_file': fd_to_file
+    }
+
+def parse_in_parallel(parser, paths):
+    """Run parser over paths using one worker process per CPU, in path order"""
+    # Every capture is independent and the strace parse is CPU-bound in
+    # the interpreter, so processes rather than threads
+    workers = min(len(paths), os.cpu_count() or 1)
+    if workers <= 1:
+        return [parser(path) for path in paths]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parser, paths))
+
+def scan_trace_dirs(ebpf_dir, strace_dir):
+    """Return the set of paths present in every directory traces may live in"""
+    # One scandir per directory replaces a stat per candidate name per size
+    present = set()
+    dirs = [Path(ebpf_dir) / subdir
+            for subdir in ['write_traces', 'write', 'read_traces', 'read', 'traces']]
+    dirs += [Path(strace_dir) / 'write', Path(strace_dir) / 'read']
+    for directory in dirs:
+        try:
+            with os.scandir(directory) as entries:
+                present.update(directory / entry.name for entry in entries)
+        except OSError:
+            continue
+    return present
+
+def find_trace_files(ebpf_dir, strace_dir, size_name, present):
+    """Locate the eBPF and strace traces for one object size"""
+    ebpf_write = None
+    ebpf_read = None
+    
+    # Try different possible paths for eBPF traces
+    for subdir in ['write_traces', 'write', 'traces']:
+        path = Path(ebpf_dir) / subdir / f'{size_name}_write.log'
+        if path not in present:
+            path = Path(ebpf_dir) / subdir / f'{size_name}_write.trace'
+        if path in present:
+            ebpf_write = path
+            break
+    
+    for subdir in ['read_traces', 'read', 'traces']:
+        path = Path(ebpf_dir) / subdir / f'{size_name}_read.log'
+        if path not in present:
+            path = Path(ebpf_dir) / subdir / f'{size_name}_read.trace'
+        if path in present:
+            ebpf_read = path
+            break
+    
+    strace_write = Path(strace_dir) / 'write' / f'{size_name}_write.strace'
+    strace_read = Path(strace_dir) / 'read' / f'{size_name}_read.strace'
+    return ebpf_write, ebpf_read, strace_write, strace_read
+
+def prefetch_files(paths):
+    """Start kernel readahead for every trace before any of them is parsed"""
+    # WILLNEED queues the reads asynchronously, so later files load from
+    # disk while earlier ones are being parsed
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
 
 def analyze_directories(ebpf_dir, strace_dir):
     """Analyze both eBPF and strace directories"""
@@ -143,45 +236,35 @@ def analyze_directories(ebpf_dir, strace_dir):
     print("I/O Path: Application Request → MinIO Syscalls → Filesystem Layer → Block Device")
     print()
     
+    present = scan_trace_dirs(ebpf_dir, strace_dir)
+    traces = {size_name: find_trace_files(ebpf_dir, strace_dir, size_name, present)
+              for size_name in sizes}
+    prefetch_files(path for paths in traces.values() for path in paths if path in present)
+    strace_paths = [path for paths in traces.values() for path in paths[2:]
+                    if path in present]
+    strace_results = dict(zip(strace_paths,
+                              parse_in_parallel(parse_strace_file, strace_paths)))
+    
+    # Summary table rows, one per size, filled in while each size is analyzed
+    summary_rows = []
+    
     # Process each size
     for size_name, size_bytes in sizes.items():
         print(f"\n{'='*120}")
         print(f"{size_name} ({size_bytes:,} bytes)")
         print('='*120)
         
-        # Find eBPF files
-        ebpf_write = None
-        ebpf_read = None
-        
-        # Try different possible paths for eBPF traces
-        for subdir in ['write_traces', 'write', 'traces']:
-            path = Path(ebpf_dir) / subdir / f'{size_name}_write.log'
-            if not path.exists():
-                path = Path(ebpf_dir) / subdir / f'{size_name}_write.trace'
-            if path.exists():
-                ebpf_write = path
-                break
-        
-        for subdir in ['read_traces', 'read', 'traces']:
-            path = Path(ebpf_dir) / subdir / f'{size_name}_read.log'
-            if not path.exists():
-                path = Path(ebpf_dir) / subdir / f'{size_name}_read.trace'
-            if path.exists():
-                ebpf_read = path
-                break
-        
-        # Find strace files
-        strace_write = Path(strace_dir) / 'write' / f'{size_name}_write.strace'
-        strace_read = Path(strace_dir) / 'read' / f'{size_name}_read.strace'
+        ebpf_write, ebpf_read, strace_write, strace_read = traces[size_name]
+        write_columns = None
         
         # WRITE OPERATION ANALYSIS
         print("\n" + "─"*80)
         print("WRITE OPERATION")
         print("─"*80)
         
-        if ebpf_write and ebpf_write.exists() and strace_write.exists():
+        if ebpf_write and strace_write in present:
             ebpf_metrics = parse_ebpf_trace(ebpf_write)
-            strace_metrics = parse_strace_file(strace_write)
+            strace_metrics = strace_results[strace_write]
             
             print(f"\n1. APPLICATION LAYER (eBPF):")
             print(f"   Request size:        {size_bytes:,} bytes")
@@ -211,6 +294,9 @@ def analyze_directories(ebpf_dir, strace_dir):
             print(f"   Device amplification:  {device_amp:.2f}x (what hits disk)")
             print(f"   Gap factor:           {device_amp/syscall_amp if syscall_amp > 0 else 0:.2f}x (filesystem overhead)")
             
+            w_syscalls = strace_metrics['syscall_writes'] + strace_metrics['syscall_reads']
+            write_columns = f"{w_syscalls:>10,} {ebpf_metrics['device_bytes']:>10,} {device_amp:>8.1f}x"
+            
             # Explain the gap
             if ebpf_metrics['device_bytes'] > (strace_metrics['syscall_writes'] + strace_metrics['syscall_reads']):
                 gap = ebpf_metrics['device_bytes'] - (strace_metrics['syscall_writes'] + strace_metrics['syscall_reads'])
@@ -231,9 +317,9 @@ def analyze_directories(ebpf_dir, strace_dir):
         print("READ OPERATION")
         print("─"*80)
         
-        if ebpf_read and ebpf_read.exists() and strace_read.exists():
+        if ebpf_read and strace_read in present:
             ebpf_metrics = parse_ebpf_trace(ebpf_read)
-            strace_metrics = parse_strace_file(strace_read)
+            strace_metrics = strace_results[strace_read]
             
             print(f"\n1. APPLICATION LAYER (eBPF):")
             print(f"   Request size:        {size_bytes:,} bytes")
@@ -261,6 +347,12 @@ def analyze_directories(ebpf_dir, strace_dir):
             print(f"   Syscall amplification: {syscall_amp:.2f}x")
             print(f"   Device amplification:  {device_amp:.2f}x")
             print(f"   Gap factor:           {device_amp/syscall_amp if syscall_amp > 0 else 0:.2f}x")
+            
+            # Sizes with both operations captured get a summary row
+            if write_columns is not None:
+                r_syscalls = strace_metrics['syscall_reads'] + strace_metrics['syscall_writes']
+                summary_rows.append(f"{size_name:>6} | {write_columns} | "
+                                    f"{r_syscalls:>10,} {ebpf_metrics['device_bytes']:>10,} {device_amp:>8.1f}x")
     
     # Summary table
     print("\n" + "=" * 120)
@@ -271,44 +363,17 @@ def analyze_directories(ebpf_dir, strace_dir):
     print(f"{'':>6} | {'Syscalls':>10} {'Device':>10} {'Amp':>8} | {'Syscalls':>10} {'Device':>10} {'Amp':>8}")
     print("-" * 70)
     
-    for size_name, size_bytes in sizes.items():
-        # Parse files again for summary
-        ebpf_write = None
-        ebpf_read = None
-        for subdir in ['write_traces', 'write', 'traces']:
-            path = Path(ebpf_dir) / subdir / f'{size_name}_write.log'
-            if not path.exists():
-                path = Path(ebpf_dir) / subdir / f'{size_name}_write.trace'
-            if path.exists():
-                ebpf_write = path
-                break
-        
-        for subdir in ['read_traces', 'read', 'traces']:
-            path = Path(ebpf_dir) / subdir / f'{size_name}_read.log'
-            if not path.exists():
-                path = Path(ebpf_dir) / subdir / f'{size_name}_read.trace'
-            if path.exists():
-                ebpf_read = path
-                break
-        
-        strace_write = Path(strace_dir) / 'write' / f'{size_name}_write.strace'
-        strace_read = Path(strace_dir) / 'read' / f'{size_name}_read.strace'
-        
-        if ebpf_write and ebpf_write.exists() and strace_write.exists() and \
-           ebpf_read and ebpf_read.exists() and strace_read.exists():
-            
-            w_ebpf = parse_ebpf_trace(ebpf_write)
-            w_strace = parse_strace_file(strace_write)
-            r_ebpf = parse_ebpf_trace(ebpf_read)
-            r_strace = parse_strace_file(strace_read)
-            
-            w_syscalls = w_strace['syscall_writes'] + w_strace['syscall_reads']
-            r_syscalls = r_strace['syscall_reads'] + r_strace['syscall_writes']
-            w_amp = w_ebpf['device_bytes'] / size_bytes if size_bytes > 0 else 0
-            r_amp = r_ebpf['device_bytes'] / size_bytes if size_bytes > 0 else 0
-            
-            print(f"{size_name:>6} | {w_syscalls:>10,} {w_ebpf['device_bytes']:>10,} {w_amp:>8.1f}x | "
-                  f"{r_syscalls:>10,} {r_ebpf['device_bytes']:>10,} {r_amp:>8.1f}x")
+    for row in summary_rows:
+        print(row)
+
+def find_latest_dir(pattern):
+    """Return the lexically last directory in the cwd matching pattern"""
+    # One scandir pass; entry types come from the directory listing itself,
+    # so no per-candidate stat calls are needed
+    names = [entry.name for entry in os.scandir('.')
+             if not entry.name.startswith('.') and entry.is_dir()
+             and fnmatch.fnmatchcase(entry.name, pattern)]
+    return max(names) if names else None
 
 if __name__ == "__main__":
     if len(sys.argv) > 2:
@@ -316,13 +381,10 @@ if __name__ == "__main__":
         strace_dir = sys.argv[2]
     else:
         # Try to find directories
-        import glob
-        ebpf_dirs = sorted(glob.glob("*rw_results_*"))
-        strace_dirs = sorted(glob.glob("strace_capture_*"))
+        ebpf_dir = find_latest_dir("*rw_results_*")
+        strace_dir = find_latest_dir("strace_capture_*")
         
-        if ebpf_dirs and strace_dirs:
-            ebpf_dir = ebpf_dirs[-1]
-            strace_dir = strace_dirs[-1]
+        if ebpf_dir and strace_dir:
             print(f"Using eBPF dir: {ebpf_dir}")
             print(f"Using strace dir: {strace_dir}")
         else:
@@ -192,6 +192,11 @@ analyze_trace() {
     python3 - << EOF
 import re
 
+# Line classifiers compiled once; each alternative starts with its own
+# literal, and the case-insensitive match avoids lowering every line
+MINIO_LINE_RE = re.compile(r'PID:|(?i:minio)')
+WINDOW_START_RE = re.compile(r'XL_META|FS_SYNC|APP_')
+
 trace_file = "$trace_file"
 operation = "$operation"
 name = "$name"
@@ -221,11 +226,11 @@ with open(trace_file, 'r') as f:
             continue
             
         # Check for PID information (if your tracer includes it)
-        if 'PID:' in line or 'minio' in line.lower():
+        if MINIO_LINE_RE.search(line):
             stats['minio_syscalls'] += 1
             
         # Detect operation window
-        if 'XL_META' in line or 'FS_SYNC' in line or 'APP_' in line:
+        if WINDOW_START_RE.search(line):
             in_window = True
             
         if not in_window:
@@ -363,13 +368,34 @@ echo "" >> $ANALYSIS_FILE
 echo "All I/O measurements are filtered to MinIO process activity only" >> $ANALYSIS_FILE
 echo "" >> $ANALYSIS_FILE
 
+# Every trace is analyzed independently, so run them all in the
+# background and append the reports in size order once they finish
+REPORT_DIR=$(mktemp -d)
+trap 'rm -rf "$REPORT_DIR"' EXIT
+ANALYZE_PIDS=()
+for op in write read; do
+    for i in ${!SIZES[@]}; do
+        analyze_trace "$RESULTS_DIR/${op}_traces/${NAMES[$i]}_${op}.log" \
+                      "$op" "${NAMES[$i]}" ${SIZES[$i]} > "$REPORT_DIR/${op}_$i.txt" &
+        ANALYZE_PIDS+=($!)
+    done
+done
+# Wait on each job so a failed analysis is not masked by a later one
+ANALYZE_RC=0
+for pid in "${ANALYZE_PIDS[@]}"; do
+    wait "$pid" || ANALYZE_RC=1
+done
+if [ $ANALYZE_RC -ne 0 ]; then
+    echo -e "${RED}ERROR: Trace analysis failed${NC}"
+    exit 1
+fi
+
 # Analyze write operations
 echo "WRITE OPERATIONS (MinIO Process Only)" >> $ANALYSIS_FILE
 echo "--------------------------------------" >> $ANALYSIS_FILE
 for i in ${!SIZES[@]}; do
     echo "" >> $ANALYSIS_FILE
-    analyze_trace "$RESULTS_DIR/write_traces/${NAMES[$i]}_write.log" \
-                  "write" "${NAMES[$i]}" ${SIZES[$i]} >> $ANALYSIS_FILE
+    cat "$REPORT_DIR/write_$i.txt" >> $ANALYSIS_FILE
 done
 
 echo "" >> $ANALYSIS_FILE
@@ -377,9 +403,9 @@ echo "READ OPERATIONS (MinIO Process Only)" >> $ANALYSIS_FILE
 echo "------------------------------------" >> $ANALYSIS_FILE
 for i in ${!SIZES[@]}; do
     echo "" >> $ANALYSIS_FILE
-    analyze_trace "$RESULTS_DIR/read_traces/${NAMES[$i]}_read.log" \
-                  "read" "${NAMES[$i]}" ${SIZES[$i]} >> $ANALYSIS_FILE
+    cat "$REPORT_DIR/read_$i.txt" >> $ANALYSIS_FILE
 done
+rm -rf "$REPORT_DIR"
 
 # Display summary
 cat $ANALYSIS_FILE
@@ -3,12 +3,90 @@
 # Fixed script to correctly parse actual test bytes from MinIO trace logs
 # File: parse_actual_bytes_fixed.py
 
+import os
 import sys
 import re
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, deque
 import json
 
+# Operation sizes that mark small-object test I/O (payloads, xl.meta
+# writes and their aligned forms), checked once per entry
+_SMALL_TEST_SIZES = frozenset({1, 10, 25, 100, 468, 563, 1024})
+
+# Accumulator codes for categorized test operations
+(APP_PUT, APP_GET, OS_WRITE, OS_READ, STORAGE_META, FS_SYNC,
+ DEV_SUBMIT, DEV_COMPLETE, UNCATEGORIZED) = range(9)
+
+def classify_event(layer, event):
+    """Map a (layer, event) pair to the accumulator code it feeds"""
+    # Application layer
+    if layer == 'APPLICATION':
+        if 'PUT' in event:
+            return APP_PUT
+        if 'GET' in event:
+            return APP_GET
+    
+    # OS layer
+    elif layer == 'OS':
+        if 'WRITE' in event:
+            return OS_WRITE
+        if 'READ' in event:
+            return OS_READ
+    
+    # Storage service layer
+    elif layer == 'STORAGE_SVC':
+        if 'META' in event:
+            return STORAGE_META
+    
+    # Filesystem layer
+    elif layer == 'FILESYSTEM':
+        if 'SYNC' in event:
+            return FS_SYNC
+    
+    # Device layer
+    elif layer == 'DEVICE':
+        if 'SUBMIT' in event:
+            return DEV_SUBMIT
+        if 'COMPLETE' in event:
+            return DEV_COMPLETE
+    
+    return UNCATEGORIZED
+
+def iter_with_context(entries, radius):
+    """Yield (entry, has_metadata, has_sync) for each entry, where the flags
+    tell whether an XL_META / FS_SYNC event lies within radius entries"""
+    # The window holds at most radius entries either side of the next
+    # entry to yield, with running counts of the flagged ones in it
+    window = deque()
+    meta = sync = 0
+    pos = 0
+    
+    for entry in entries:
+        is_meta = 'XL_META' in entry['event']
+        is_sync = 'FS_SYNC' in entry['event']
+        window.append((entry, is_meta, is_sync))
+        meta += is_meta
+        sync += is_sync
+        if pos + radius < len(window):
+            yield window[pos][0], meta > 0, sync > 0
+            pos += 1
+            if pos > radius:
+                _, is_meta, is_sync = window.popleft()
+                meta -= is_meta
+                sync -= is_sync
+                pos -= 1
+    
+    # Drain the tail; no entries remain to look ahead to
+    while pos < len(window):
+        yield window[pos][0], meta > 0, sync > 0
+        pos += 1
+        if pos > radius:
+            _, is_meta, is_sync = window.popleft()
+            meta -= is_meta
+            sync -= is_sync
+            pos -= 1
+
 class IOTraceParser:
     def __init__(self, trace_file):
         self.trace_file = trace_file
@@ -18,19 +96,37 @@ class IOTraceParser:
         self.test_operations = {
             'application': {'puts': [], 'gets': []},
             'os': {'reads': [], 'writes': []},
-            'storage': {'metadata': []},
-            'filesystem': {'syncs': []},
-            'device': {'submits': [], 'completes': []}
+            'storage': {'metadata_count': 0, 'metadata_bytes': 0},
+            'filesystem': {'sync_count': 0, 'sync_bytes': 0},
+            'device': {'submits': [], 'complete_count': 0, 'complete_bytes': 0}
         }
         
+        # Direct references to the per-layer accumulators so categorizing
+        # an event does not walk two dict levels each time
+        self._puts = self.test_operations['application']['puts']
+        self._gets = self.test_operations['application']['gets']
+        self._os_writes = self.test_operations['os']['writes']
+        self._os_reads = self.test_operations['os']['reads']
+        self._submits = self.test_operations['device']['submits']
+        self._storage = self.test_operations['storage']
+        self._filesystem = self.test_operations['filesystem']
+        self._device = self.test_operations['device']
+        
+        # (layer, event) -> accumulator code, filled on first sight
+        self._event_codes = {}
+        
+        # Canonical copies of the few distinct layer/event/comm tokens, so
+        # every stored entry shares them instead of holding its own strings
+        self._tokens = {}
+        
         # Background operations (heartbeat, etc.)
         self.background_ops = {
             'heartbeat_count': 0,
             'heartbeat_bytes': 0
         }
         
-        # Timeline of significant events
-        self.significant_events = []
+        # Filtered totals shared by the report and JSON export
+        self._test_io_summary = None
         
     def detect_test_size(self):
         """Detect the test size from filename"""
@@ -69,7 +165,7 @@ class IOTraceParser:
             return True
         return False
     
-    def is_test_operation(self, entry, context_window):
+    def is_test_operation(self, entry, has_metadata, has_sync):
         """Identify if this is part of the actual test operation"""
         # Test operations are identified by:
         # 1. Proximity to metadata operations (xl.meta)
@@ -77,16 +173,12 @@ class IOTraceParser:
         # 3. Occurring in bursts (not regular intervals)
         # 4. Associated with actual data sizes or their aligned versions
         
-        # Look for metadata operations in the context window
-        has_metadata = any('XL_META' in e.get('event', '') for e in context_window)
-        has_sync = any('FS_SYNC' in e.get('event', '') for e in context_window)
-        
         # For small tests (< 1KB), actual operations cluster around metadata/sync
         if self.test_size < 1024:
             if has_metadata or has_sync:
                 return True
             # Small operations that match or are close to test size
-            if entry['size'] in [1, 10, 25, 100, 468, 563, 1024]:
+            if entry['size'] in _SMALL_TEST_SIZES:
                 return True
         
         # For larger tests, look for operations matching the size
@@ -97,23 +189,26 @@ class IOTraceParser:
     
     def parse_line(self, line):
         """Parse a single trace line"""
-        if 'TIME' in line or '===' in line or '>>>' in line or not line.strip():
+        # Event rows start with a HH:MM:SS timestamp; one character test
+        # rejects banners, headers, separators and summary tables
+        if not line[:1].isdigit():
             return None
             
         parts = line.split()
         if len(parts) < 7:
             return None
             
+        tokens = self._tokens
         try:
             entry = {
                 'timestamp': parts[0],
-                'layer': parts[1],
-                'event': parts[2],
+                'layer': tokens.setdefault(parts[1], parts[1]),
+                'event': tokens.setdefault(parts[2], parts[2]),
                 'size': int(parts[3]),
                 'aligned_size': int(parts[4]),
                 'latency': float(parts[5]),
-                'comm': parts[6] if len(parts) > 6 else '',
-                'flags': ' '.join(parts[7:]) if len(parts) > 7 else ''
+                'comm': tokens.setdefault(parts[6], parts[6]) if len(parts) > 6 else '',
+                'flags': ' '.join(parts[7:])
             }
             return entry
         except (ValueError, IndexError):
@@ -122,81 +217,76 @@ class IOTraceParser:
     def parse_file(self):
         """Parse the trace file and separate test from background operations"""
         
-        all_entries = []
-        
-        # First pass: collect all entries
+        # Stream entries through a sliding context window (±5 entries)
+        # rather than holding every parsed line for a second pass
         with open(self.trace_file, 'r') as f:
-            for line in f:
-                entry = self.parse_line(line)
-                if entry:
-                    all_entries.append(entry)
-        
-        # Second pass: identify test operations using context windows
-        for i, entry in enumerate(all_entries):
-            # Create context window (±5 entries)
-            start_idx = max(0, i - 5)
-            end_idx = min(len(all_entries), i + 6)
-            context = all_entries[start_idx:end_idx]
-            
-            # Skip heartbeat operations
-            if self.is_heartbeat_operation(entry):
-                self.background_ops['heartbeat_count'] += 1
-                self.background_ops['heartbeat_bytes'] += entry['size']
-                continue
-            
-            # Check if this is a test operation
-            if self.is_test_operation(entry, context):
-                self.categorize_test_operation(entry)
-            else:
-                # Still count as background if not identified as test
-                if entry['size'] == 8:
+            entries = filter(None, map(self.parse_line, f))
+            for entry, has_metadata, has_sync in iter_with_context(entries, 5):
+                # Skip heartbeat operations
+                if self.is_heartbeat_operation(entry):
                     self.background_ops['heartbeat_count'] += 1
                     self.background_ops['heartbeat_bytes'] += entry['size']
+                    continue
+                
+                # Check if this is a test operation
+                if self.is_test_operation(entry, has_metadata, has_sync):
+                    self.categorize_test_operation(entry)
+                else:
+                    # Still count as background if not identified as test
+                    if entry['size'] == 8:
+                        self.background_ops['heartbeat_count'] += 1
+                        self.background_ops['heartbeat_bytes'] += entry['size']
     
     def categorize_test_operation(self, entry):
         """Categorize a test operation by layer and type"""
         
-        layer = entry['layer']
-        event = entry['event']
         size = entry['size']
-        aligned_size = entry['aligned_size']
-        
-        # Add to significant events
-        self.significant_events.append(entry)
         
-        # Application layer
-        if layer == 'APPLICATION':
-            if 'PUT' in event:
-                self.test_operations['application']['puts'].append(size)
-            elif 'GET' in event:
-                self.test_operations['application']['gets'].append(size)
-        
-        # OS layer
-        elif layer == 'OS':
-            if 'WRITE' in event:
-                self.test_operations['os']['writes'].append(aligned_size)
-            elif 'READ' in event:
-                self.test_operations['os']['reads'].append(aligned_size)
-        
-        # Storage service layer
-        elif layer == 'STORAGE_SVC':
-            if 'META' in event:
-                # xl.meta files are typically 450-550 bytes
-                metadata_size = 450
-                self.test_operations['storage']['metadata'].append(metadata_size)
-        
-        # Filesystem layer
-        elif layer == 'FILESYSTEM':
-            if 'SYNC' in event:
-                # Each sync triggers a 4KB journal write
-                self.test_operations['filesystem']['syncs'].append(4096)
-        
-        # Device layer
-        elif layer == 'DEVICE':
-            if 'SUBMIT' in event:
-                self.test_operations['device']['submits'].append(size)
-            elif 'COMPLETE' in event:
-                self.test_operations['device']['completes'].append(size)
+        # Traces use a small fixed vocabulary of (layer, event) pairs, so
+        # each pair is classified once and later events hit the cache
+        key = (entry['layer'], entry['event'])
+        code = self._event_codes.get(key)
+        if code is None:
+            code = self._event_codes[key] = classify_event(*key)
+        
+        if code == APP_PUT:
+            self._puts.append(size)
+        elif code == APP_GET:
+            self._gets.append(size)
+        elif code == OS_WRITE:
+            self._os_writes.append(entry['aligned_size'])
+        elif code == OS_READ:
+            self._os_reads.append(entry['aligned_size'])
+        elif code == STORAGE_META:
+            # xl.meta files are typically 450-550 bytes
+            self._storage['metadata_count'] += 1
+            self._storage['metadata_bytes'] += 450
+        elif code == FS_SYNC:
+            # Each sync triggers a 4KB journal write
+            self._filesystem['sync_count'] += 1
+            self._filesystem['sync_bytes'] += 4096
+        elif code == DEV_SUBMIT:
+            self._submits.append(size)
+        elif code == DEV_COMPLETE:
+            self._device['complete_count'] += 1
+            self._device['complete_bytes'] += size
+    
+    def summarize_test_io(self):
+        """Heartbeat-filtered application I/O and device totals"""
+        if self._test_io_summary is None:
+            puts = [p for p in self.test_operations['application']['puts'] if p != 8]
+            gets = [g for g in self.test_operations['application']['gets'] if g != 8]
+            put_total = sum(puts)
+            get_total = sum(gets)
+            self._test_io_summary = {
+                'puts': puts,
+                'gets': gets,
+                'put_total': put_total,
+                'get_total': get_total,
+                'app_total': put_total + get_total,
+                'device_total': sum(self.test_operations['device']['submits'])
+            }
+        return self._test_io_summary
     
     def generate_report(self):
         """Generate a report of actual test bytes"""
@@ -218,26 +308,24 @@ class IOTraceParser:
         report.append("1. APPLICATION LAYER (Actual Test I/O)")
         report.append("-" * 40)
         
-        puts = self.test_operations['application']['puts']
-        gets = self.test_operations['application']['gets']
-        
-        # Filter out heartbeat-like operations
-        puts = [p for p in puts if p != 8]
-        gets = [g for g in gets if g != 8]
+        # Heartbeat-like operations are already filtered out
+        summary = self.summarize_test_io()
+        puts = summary['puts']
+        gets = summary['gets']
         
         if puts:
             report.append(f"PUT Operations:")
             report.append(f"  Count: {len(puts)}")
             report.append(f"  Sizes: {puts}")
-            report.append(f"  Total: {sum(puts):,} bytes")
+            report.append(f"  Total: {summary['put_total']:,} bytes")
         
         if gets:
             report.append(f"GET Operations:")
             report.append(f"  Count: {len(gets)}")
             report.append(f"  Sizes: {gets}")
-            report.append(f"  Total: {sum(gets):,} bytes")
+            report.append(f"  Total: {summary['get_total']:,} bytes")
         
-        app_total = sum(puts) + sum(gets)
+        app_total = summary['app_total']
         report.append(f"TOTAL Application Test I/O: {app_total:,} bytes")
         report.append(f"Expected: ~{self.test_size * 2} bytes (PUT + GET)")
         report.append("")
@@ -249,23 +337,28 @@ class IOTraceParser:
         writes = self.test_operations['os']['writes']
         reads = self.test_operations['os']['reads']
         
-        # Filter out regular heartbeat patterns
-        writes = [w for w in writes if w != 4096 or len(writes) < 10]
-        reads = [r for r in reads if r != 4096 or len(reads) < 10]
+        # Filter out regular heartbeat patterns (only once there are
+        # enough operations for 4KB writes/reads to be periodic)
+        if len(writes) >= 10:
+            writes = [w for w in writes if w != 4096]
+        if len(reads) >= 10:
+            reads = [r for r in reads if r != 4096]
+        writes_total = sum(writes)
+        reads_total = sum(reads)
         
         if writes:
             report.append(f"VFS Write Operations:")
             report.append(f"  Count: {len(writes)}")
             report.append(f"  Sizes: {writes[:10]}{'...' if len(writes) > 10 else ''}")
-            report.append(f"  Total: {sum(writes):,} bytes")
+            report.append(f"  Total: {writes_total:,} bytes")
         
         if reads:
             report.append(f"VFS Read Operations:")
             report.append(f"  Count: {len(reads)}")
             report.append(f"  Sizes: {reads[:10]}{'...' if len(reads) > 10 else ''}")
-            report.append(f"  Total: {sum(reads):,} bytes")
+            report.append(f"  Total: {reads_total:,} bytes")
         
-        os_total = sum(writes) + sum(reads)
+        os_total = writes_total + reads_total
         report.append(f"TOTAL OS Test I/O: {os_total:,} bytes")
         report.append("")
         
@@ -273,22 +366,22 @@ class IOTraceParser:
         report.append("3. STORAGE SERVICE LAYER")
         report.append("-" * 40)
         
-        metadata = self.test_operations['storage']['metadata']
-        if metadata:
+        storage = self.test_operations['storage']
+        if storage['metadata_count']:
             report.append(f"Metadata Operations (xl.meta):")
-            report.append(f"  Count: {len(metadata)}")
-            report.append(f"  Total: {sum(metadata):,} bytes")
+            report.append(f"  Count: {storage['metadata_count']}")
+            report.append(f"  Total: {storage['metadata_bytes']:,} bytes")
         report.append("")
         
         # Filesystem/Journal layer
         report.append("4. FILESYSTEM LAYER")
         report.append("-" * 40)
         
-        syncs = self.test_operations['filesystem']['syncs']
-        if syncs:
+        filesystem = self.test_operations['filesystem']
+        if filesystem['sync_count']:
             report.append(f"Journal Operations (FS_SYNC):")
-            report.append(f"  Count: {len(syncs)}")
-            report.append(f"  Total: {sum(syncs):,} bytes")
+            report.append(f"  Count: {filesystem['sync_count']}")
+            report.append(f"  Total: {filesystem['sync_bytes']:,} bytes")
         report.append("")
         
         # Device layer
@@ -300,9 +393,9 @@ class IOTraceParser:
             report.append(f"BIO Submit Operations:")
             report.append(f"  Count: {len(submits)}")
             report.append(f"  Sizes: {submits}")
-            report.append(f"  Total: {sum(submits):,} bytes")
+            report.append(f"  Total: {summary['device_total']:,} bytes")
         
-        device_total = sum(submits)
+        device_total = summary['device_total']
         report.append(f"TOTAL Device Test I/O: {device_total:,} bytes")
         report.append("")
         
@@ -319,8 +412,8 @@ class IOTraceParser:
             
             # Breakdown
             data_io = self.test_size
-            metadata_io = sum(metadata)
-            journal_io = sum(syncs)
+            metadata_io = storage['metadata_bytes']
+            journal_io = filesystem['sync_bytes']
             
             report.append("")
             report.append("I/O Breakdown:")
@@ -335,24 +428,22 @@ class IOTraceParser:
         """Export parsed data as JSON"""
         
         # Calculate actual test I/O (excluding heartbeats)
-        puts = [p for p in self.test_operations['application']['puts'] if p != 8]
-        gets = [g for g in self.test_operations['application']['gets'] if g != 8]
-        app_total = sum(puts) + sum(gets)
+        summary = self.summarize_test_io()
+        app_total = summary['app_total']
         
         # If no actual test I/O detected, use the test size
         if app_total == 0:
             app_total = self.test_size
         
-        submits = self.test_operations['device']['submits']
-        device_total = sum(submits)
+        device_total = summary['device_total']
         
         json_data = {
             'test_size': self.test_size,
             'summary': {
                 'application_total': app_total,
                 'os_total': sum(self.test_operations['os']['writes']) + sum(self.test_operations['os']['reads']),
-                'storage_total': sum(self.test_operations['storage']['metadata']),
-                'filesystem_total': sum(self.test_operations['filesystem']['syncs']),
+                'storage_total': self.test_operations['storage']['metadata_bytes'],
+                'filesystem_total': self.test_operations['filesystem']['sync_bytes'],
                 'device_total': device_total
             },
             'background': self.background_ops,
@@ -364,6 +455,16 @@ class IOTraceParser:
         
         return json_data
 
+def outputs_up_to_date(sources, outputs):
+    """True when every output exists and is newer than every source"""
+    if set(outputs) & set(sources):
+        return False
+    try:
+        oldest_output = min(os.stat(path).st_mtime_ns for path in outputs)
+    except FileNotFoundError:
+        return False
+    return oldest_output >= max(os.stat(path).st_mtime_ns for path in sources)
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python parse_actual_bytes_fixed.py <trace_log_file>")
@@ -375,6 +476,19 @@ def main():
         print(f"Error: File {trace_file} not found")
         sys.exit(1)
     
+    report_file = trace_file.replace('.log', '_fixed_analysis.txt')
+    json_file = trace_file.replace('.log', '_fixed_data.json')
+    
+    # A report and JSON written after both the trace and this script last
+    # changed are still current, so print the saved report instead
+    if outputs_up_to_date([trace_file, __file__], [report_file, json_file]):
+        print(f"Unchanged since last parse: {trace_file}")
+        print("-" * 40)
+        print(Path(report_file).read_text())
+        print(f"\nReport: {report_file}")
+        print(f"JSON data: {json_file}")
+        return
+    
     print(f"Parsing: {trace_file}")
     print("-" * 40)
     
@@ -386,13 +500,11 @@ def main():
     print(report)
     
     # Save report
-    report_file = trace_file.replace('.log', '_fixed_analysis.txt')
     with open(report_file, 'w') as f:
         f.write(report)
     print(f"\nReport saved to: {report_file}")
     
     # Export JSON
-    json_file = trace_file.replace('.log', '_fixed_data.json')
     parser.export_json(json_file)
     print(f"JSON data saved to: {json_file}")
 
@@ -15,6 +15,15 @@ def plot_results(csv_file):
     # Read the CSV data
     df = pd.read_csv(csv_file)
     
+    # Column arrays shared by every panel and the individual plots
+    arrays = {
+        'amplification': df['Amplification'].to_numpy(),
+        'object_size': df['Object_Size'].to_numpy(),
+        'data': df['Data_Percent'].to_numpy(),
+        'metadata': df['Metadata_Percent'].to_numpy(),
+        'journal': df['Journal_Percent'].to_numpy(),
+    }
+    
     # Create figure with subplots
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     fig.suptitle('MinIO I/O Amplification Analysis', fontsize=16, fontweight='bold')
@@ -25,7 +34,7 @@ def plot_results(csv_file):
     
     # 1. Amplification Factor (log scale)
     ax1 = axes[0, 0]
-    ax1.bar(x_pos, df['Amplification'], color='red', alpha=0.7)
+    bars = ax1.bar(x_pos, arrays['amplification'], color='red', alpha=0.7)
     ax1.set_xlabel('Object Size')
     ax1.set_ylabel('Amplification Factor (x)')
     ax1.set_title('I/O Amplification by Object Size')
@@ -35,19 +44,18 @@ def plot_results(csv_file):
     ax1.grid(True, alpha=0.3)
     
     # Add value labels on bars
-    for i, v in enumerate(df['Amplification']):
-        ax1.text(i, v, f'{v:.1f}x', ha='center', va='bottom')
+    ax1.bar_label(bars, fmt='%.1fx')
     
     # 2. I/O Distribution Stacked Bar
     ax2 = axes[0, 1]
     width = 0.6
     
     # Create stacked bars
-    p1 = ax2.bar(x_pos, df['Data_Percent'], width, label='Data', color='#2ecc71')
-    p2 = ax2.bar(x_pos, df['Metadata_Percent'], width, bottom=df['Data_Percent'],
+    p1 = ax2.bar(x_pos, arrays['data'], width, label='Data', color='#2ecc71')
+    p2 = ax2.bar(x_pos, arrays['metadata'], width, bottom=arrays['data'],
                  label='Metadata', color='#3498db')
-    p3 = ax2.bar(x_pos, df['Journal_Percent'], width, 
-                 bottom=df['Data_Percent'] + df['Metadata_Percent'],
+    p3 = ax2.bar(x_pos, arrays['journal'], width, 
+                 bottom=arrays['data'] + arrays['metadata'],
                  label='Journal', color='#e74c3c')
     
     ax2.set_xlabel('Object Size')
@@ -61,7 +69,7 @@ def plot_results(csv_file):
     
     # 3. Amplification Trend Line (log-log plot)
     ax3 = axes[1, 0]
-    ax3.loglog(df['Object_Size'], df['Amplification'], 'o-', color='blue', 
+    ax3.loglog(arrays['object_size'], arrays['amplification'], 'o-', color='blue', 
                linewidth=2, markersize=8)
     ax3.set_xlabel('Object Size (bytes)')
     ax3.set_ylabel('Amplification Factor (x)')
@@ -81,12 +89,12 @@ def plot_results(csv_file):
     ax4 = axes[1, 1]
     
     # Calculate overhead (metadata + journal)
-    overhead_percent = df['Metadata_Percent'] + df['Journal_Percent']
+    overhead_percent = arrays['metadata'] + arrays['journal']
     
     x = np.arange(len(size_labels))
     width = 0.35
     
-    rects1 = ax4.bar(x - width/2, df['Data_Percent'], width, label='Data %', 
+    rects1 = ax4.bar(x - width/2, arrays['data'], width, label='Data %', 
                      color='#27ae60')
     rects2 = ax4.bar(x + width/2, overhead_percent, width, label='Overhead %', 
                      color='#c0392b')
@@ -100,21 +108,8 @@ def plot_results(csv_file):
     ax4.grid(True, alpha=0.3)
     
     # Add value labels on bars
-    for rect in rects1:
-        height = rect.get_height()
-        ax4.annotate(f'{height:.0f}%',
-                    xy=(rect.get_x() + rect.get_width() / 2, height),
-                    xytext=(0, 3),
-                    textcoords="offset points",
-                    ha='center', va='bottom', fontsize=8)
-    
-    for rect in rects2:
-        height = rect.get_height()
-        ax4.annotate(f'{height:.0f}%',
-                    xy=(rect.get_x() + rect.get_width() / 2, height),
-                    xytext=(0, 3),
-                    textcoords="offset points",
-                    ha='center', va='bottom', fontsize=8)
+    ax4.bar_label(rects1, fmt='%.0f%%', padding=3, fontsize=8)
+    ax4.bar_label(rects2, fmt='%.0f%%', padding=3, fontsize=8)
     
     plt.tight_layout()
     
@@ -124,11 +119,11 @@ def plot_results(csv_file):
     print(f"Plot saved to: {output_file}")
     
     # Also save individual plots
-    save_individual_plots(df, csv_file)
+    save_individual_plots(arrays, csv_file)
     
     plt.show()
 
-def save_individual_plots(df, csv_file):
+def save_individual_plots(arrays, csv_file):
     """Save individual plots for detailed analysis"""
     
     base_dir = Path(csv_file).parent
@@ -137,8 +132,8 @@ def save_individual_plots(df, csv_file):
     # 1. Amplification comparison
     plt.figure(figsize=(10, 6))
     colors = ['red' if x > 100 else 'orange' if x > 10 else 'green' 
-              for x in df['Amplification']]
-    plt.bar(size_labels, df['Amplification'], color=colors, alpha=0.7)
+              for x in arrays['amplification']]
+    bars = plt.bar(size_labels, arrays['amplification'], color=colors, alpha=0.7)
     plt.xlabel('Object Size', fontsize=12)
     plt.ylabel('Amplification Factor (x)', fontsize=12)
     plt.title('MinIO I/O Amplification by Object Size', fontsize=14, fontweight='bold')
@@ -151,8 +146,7 @@ def save_individual_plots(df, csv_file):
     plt.axhline(y=100, color='red', linestyle='--', alpha=0.5, label='Poor')
     plt.legend()
     
-    for i, v in enumerate(df['Amplification']):
-        plt.text(i, v, f'{v:.1f}x', ha='center', va='bottom')
+    plt.gca().bar_label(bars, fmt='%.1fx')
     
     plt.xticks(rotation=45)
     plt.tight_layout()
@@ -164,27 +158,27 @@ def save_individual_plots(df, csv_file):
     
     # Small object (100B)
     small_idx = 2  # 100B
-    sizes = [df.iloc[small_idx]['Data_Percent'], 
-             df.iloc[small_idx]['Metadata_Percent'],
-             df.iloc[small_idx]['Journal_Percent']]
+    sizes = [arrays['data'][small_idx], 
+             arrays['metadata'][small_idx],
+             arrays['journal'][small_idx]]
     ax1.pie(sizes, labels=['Data', 'Metadata', 'Journal'], autopct='%1.1f%%',
             colors=['#2ecc71', '#3498db', '#e74c3c'])
     ax1.set_title('100B Object I/O Distribution')
     
     # Medium object (1MB)
     med_idx = 6  # 1MB
-    sizes = [df.iloc[med_idx]['Data_Percent'], 
-             df.iloc[med_idx]['Metadata_Percent'],
-             df.iloc[med_idx]['Journal_Percent']]
+    sizes = [arrays['data'][med_idx], 
+             arrays['metadata'][med_idx],
+             arrays['journal'][med_idx]]
     ax2.pie(sizes, labels=['Data', 'Metadata', 'Journal'], autopct='%1.1f%%',
             colors=['#2ecc71', '#3498db', '#e74c3c'])
     ax2.set_title('1MB Object I/O Distribution')
     
     # Large object (100MB)
     large_idx = 8  # 100MB
-    sizes = [df.iloc[large_idx]['Data_Percent'], 
-             df.iloc[large_idx]['Metadata_Percent'],
-             df.iloc[large_idx]['Journal_Percent']]
+    sizes = [arrays['data'][large_idx], 
+             arrays['metadata'][large_idx],
+             arrays['journal'][large_idx]]
     ax3.pie(sizes, labels=['Data', 'Metadata', 'Journal'], autopct='%1.1f%%',
             colors=['#2ecc71', '#3498db', '#e74c3c'])
     ax3.set_title('100MB Object I/O Distribution')
@@ -5,6 +5,8 @@
 
 import sys
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # PDF output only; skip interactive backend setup
 import matplotlib.pyplot as plt
 import matplotlib.backends.backend_pdf as pdf_backend
 import numpy as np
@@ -16,9 +18,15 @@ plt.style.use('seaborn-v0_8-darkgrid')
 plt.rcParams['font.family'] = 'DejaVu Sans'
 plt.rcParams['font.size'] = 11
 
-def create_amplification_plot(df, output_dir):
+def reset_figure(fig, figsize, nrows=1, ncols=1):
+    """Clear the shared figure, resize it and lay out fresh axes"""
+    fig.clear()
+    fig.set_size_inches(figsize)
+    return fig.subplots(nrows, ncols)
+
+def create_amplification_plot(df, output_dir, fig):
     """Create amplification factor bar plot"""
-    fig, ax = plt.subplots(figsize=(12, 8))
+    ax = reset_figure(fig, (12, 8))
     
     size_labels = ['1B', '10B', '100B', '1KB', '10KB', '100KB', '1MB', '10MB', '100MB']
     x_pos = np.arange(len(size_labels))
@@ -29,15 +37,11 @@ def create_amplification_plot(df, output_dir):
     
     bars = ax.bar(x_pos, df['Amplification'], color=colors, alpha=0.8, edgecolor='black', linewidth=1.5)
     
-    # Add value labels on bars
-    for i, (bar, val) in enumerate(zip(bars, df['Amplification'])):
-        height = bar.get_height()
-        if val >= 1000:
-            label = f'{val/1000:.1f}K×'
-        else:
-            label = f'{val:.1f}×'
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                label, ha='center', va='bottom', fontweight='bold', fontsize=10)
+    # Add value labels on bars, unclipped so bars outside the log-axis limits
+    # keep theirs; a zero-height bar has no position on a log axis
+    labels = [(f'{val/1000:.1f}K×' if val >= 1000 else f'{val:.1f}×') if val > 0 else ''
+              for val in df['Amplification']]
+    ax.bar_label(bars, labels=labels, fontweight='bold', fontsize=10, annotation_clip=False)
     
     # Add reference lines
     ax.axhline(y=2, color='green', linestyle='--', alpha=0.5, linewidth=2, label='Ideal (2× for replication)')
@@ -58,47 +62,39 @@ def create_amplification_plot(df, output_dir):
     fig.text(0.99, 0.01, f'Generated: {datetime.datetime.now().strftime("%Y-%m-%d %H:%M")}',
              ha='right', va='bottom', fontsize=9, alpha=0.7)
     
-    plt.tight_layout()
+    fig.tight_layout()
     pdf_path = output_dir / 'amplification_factor.pdf'
-    plt.savefig(pdf_path, format='pdf', bbox_inches='tight', dpi=150)
-    plt.close()
+    fig.savefig(pdf_path, format='pdf', bbox_inches='tight', dpi=150)
     print(f"  ✓ Saved: {pdf_path}")
 
-def create_io_distribution_plot(df, output_dir):
+def create_io_distribution_plot(df, output_dir, fig):
     """Create stacked bar chart for I/O distribution"""
-    fig, ax = plt.subplots(figsize=(12, 8))
+    ax = reset_figure(fig, (12, 8))
     
     size_labels = ['1B', '10B', '100B', '1KB', '10KB', '100KB', '1MB', '10MB', '100MB']
     x_pos = np.arange(len(size_labels))
     width = 0.7
     
+    # Segment heights and bottoms as (category, size) arrays: data,
+    # metadata and journal stack in that order
+    pcts = df[['Data_Percent', 'Metadata_Percent', 'Journal_Percent']].to_numpy().T
+    bottoms = np.zeros_like(pcts)
+    bottoms[1] = pcts[0]
+    bottoms[2] = pcts[0] + pcts[1]
+    
     # Create stacked bars
-    p1 = ax.bar(x_pos, df['Data_Percent'], width, label='Data I/O', 
+    p1 = ax.bar(x_pos, pcts[0], width, label='Data I/O', 
                 color='#2ecc71', edgecolor='black', linewidth=1)
-    p2 = ax.bar(x_pos, df['Metadata_Percent'], width, bottom=df['Data_Percent'],
+    p2 = ax.bar(x_pos, pcts[1], width, bottom=bottoms[1],
                 label='Metadata I/O', color='#3498db', edgecolor='black', linewidth=1)
-    p3 = ax.bar(x_pos, df['Journal_Percent'], width, 
-                bottom=df['Data_Percent'] + df['Metadata_Percent'],
+    p3 = ax.bar(x_pos, pcts[2], width, bottom=bottoms[2],
                 label='Journal I/O', color='#e74c3c', edgecolor='black', linewidth=1)
     
-    # Add percentage labels
-    for i in range(len(size_labels)):
-        # Data percentage
-        if df['Data_Percent'][i] > 5:
-            ax.text(i, df['Data_Percent'][i]/2, f"{df['Data_Percent'][i]:.0f}%",
-                    ha='center', va='center', fontweight='bold', color='white')
-        
-        # Metadata percentage
-        if df['Metadata_Percent'][i] > 5:
-            ax.text(i, df['Data_Percent'][i] + df['Metadata_Percent'][i]/2,
-                    f"{df['Metadata_Percent'][i]:.0f}%",
-                    ha='center', va='center', fontweight='bold', color='white')
-        
-        # Journal percentage
-        if df['Journal_Percent'][i] > 5:
-            ax.text(i, df['Data_Percent'][i] + df['Metadata_Percent'][i] + df['Journal_Percent'][i]/2,
-                    f"{df['Journal_Percent'][i]:.0f}%",
-                    ha='center', va='center', fontweight='bold', color='white')
+    # Add percentage labels at segment midpoints, skipping segments of 5% or less
+    centers = bottoms + pcts / 2
+    for i, cat in zip(*np.nonzero((pcts > 5).T)):
+        ax.text(i, centers[cat, i], f"{pcts[cat, i]:.0f}%",
+                ha='center', va='center', fontweight='bold', color='white')
     
     ax.set_xlabel('Object Size', fontsize=14, fontweight='bold')
     ax.set_ylabel('Percentage of Total I/O (%)', fontsize=14, fontweight='bold')
@@ -109,15 +105,14 @@ def create_io_distribution_plot(df, output_dir):
     ax.set_ylim(0, 100)
     ax.grid(True, alpha=0.3, axis='y', linestyle='--')
     
-    plt.tight_layout()
+    fig.tight_layout()
     pdf_path = output_dir / 'io_distribution.pdf'
-    plt.savefig(pdf_path, format='pdf', bbox_inches='tight', dpi=150)
-    plt.close()
+    fig.savefig(pdf_path, format='pdf', bbox_inches='tight', dpi=150)
     print(f"  ✓ Saved: {pdf_path}")
 
-def create_loglog_plot(df, output_dir):
+def create_loglog_plot(df, output_dir, fig):
     """Create log-log plot of amplification vs size"""
-    fig, ax = plt.subplots(figsize=(12, 8))
+    ax = reset_figure(fig, (12, 8))
     
     # Plot the main trend
     ax.loglog(df['Object_Size'], df['Amplification'], 'o-', color='#2c3e50', 
@@ -152,15 +147,14 @@ def create_loglog_plot(df, output_dir):
     ax.set_xlim(0.5, 200000000)
     ax.set_ylim(1, max(df['Amplification']) * 2)
     
-    plt.tight_layout()
+    fig.tight_layout()
     pdf_path = output_dir / 'amplification_loglog.pdf'
-    plt.savefig(pdf_path, format='pdf', bbox_inches='tight', dpi=150)
-    plt.close()
+    fig.savefig(pdf_path, format='pdf', bbox_inches='tight', dpi=150)
     print(f"  ✓ Saved: {pdf_path}")
 
-def create_overhead_comparison_plot(df, output_dir):
+def create_overhead_comparison_plot(df, output_dir, fig):
     """Create comparison of data vs overhead"""
-    fig, ax = plt.subplots(figsize=(12, 8))
+    ax = reset_figure(fig, (12, 8))
     
     size_labels = ['1B', '10B', '100B', '1KB', '10KB', '100KB', '1MB', '10MB', '100MB']
     overhead_percent = df['Metadata_Percent'] + df['Journal_Percent']
@@ -175,17 +169,8 @@ def create_overhead_comparison_plot(df, output_dir):
                    color='#c0392b', alpha=0.8, edgecolor='black', linewidth=1.5)
     
     # Add value labels
-    for bar in bars1:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.0f}%', ha='center', va='bottom',
-                fontweight='bold', fontsize=10)
-    
-    for bar in bars2:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.0f}%', ha='center', va='bottom',
-                fontweight='bold', fontsize=10)
+    for bars in (bars1, bars2):
+        ax.bar_label(bars, fmt='%.0f%%', fontweight='bold', fontsize=10, annotation_clip=False)
     
     # Add 50% reference line
     ax.axhline(y=50, color='gray', linestyle=':', alpha=0.5, linewidth=2)
@@ -201,15 +186,14 @@ def create_overhead_comparison_plot(df, output_dir):
     ax.set_ylim(0, 105)
     ax.grid(True, alpha=0.3, axis='y', linestyle='--')
     
-    plt.tight_layout()
+    fig.tight_layout()
     pdf_path = output_dir / 'data_vs_overhead.pdf'
-    plt.savefig(pdf_path, format='pdf', bbox_inches='tight', dpi=150)
-    plt.close()
+    fig.savefig(pdf_path, format='pdf', bbox_inches='tight', dpi=150)
     print(f"  ✓ Saved: {pdf_path}")
 
-def create_pie_charts_comparison(df, output_dir):
+def create_pie_charts_comparison(df, output_dir, fig):
     """Create pie charts comparing small, medium, and large objects"""
-    fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+    axes = reset_figure(fig, (18, 6), 1, 3)
     
     # Define indices for different sizes
     small_idx = 2   # 100B
@@ -249,18 +233,17 @@ def create_pie_charts_comparison(df, output_dir):
     for autotext in autotexts1 + autotexts2 + autotexts3:
         autotext.set_color('white')
     
-    plt.suptitle('I/O Distribution Comparison: Small vs Medium vs Large Objects',
+    fig.suptitle('I/O Distribution Comparison: Small vs Medium vs Large Objects',
                  fontsize=16, fontweight='bold', y=1.05)
     
-    plt.tight_layout()
+    fig.tight_layout()
     pdf_path = output_dir / 'io_distribution_pies.pdf'
-    plt.savefig(pdf_path, format='pdf', bbox_inches='tight', dpi=150)
-    plt.close()
+    fig.savefig(pdf_path, format='pdf', bbox_inches='tight', dpi=150)
     print(f"  ✓ Saved: {pdf_path}")
 
-def create_summary_table(df, output_dir):
+def create_summary_table(df, output_dir, fig):
     """Create a summary table as PDF"""
-    fig, ax = plt.subplots(figsize=(14, 10))
+    ax = reset_figure(fig, (14, 10))
     ax.axis('tight')
     ax.axis('off')
     
@@ -317,17 +300,16 @@ def create_summary_table(df, output_dir):
         for j in range(6):
             table[(i, j)].set_facecolor(color)
     
-    plt.title('MinIO I/O Amplification Summary Table', fontsize=16, fontweight='bold', pad=20)
+    ax.set_title('MinIO I/O Amplification Summary Table', fontsize=16, fontweight='bold', pad=20)
     
     # Add notes
     note_text = ("Note: Amplification shows how many times the original data size is multiplied at the device layer.\n"
                  "Overhead % = Metadata % + Journal %")
-    plt.figtext(0.5, 0.08, note_text, ha='center', fontsize=10, style='italic', alpha=0.7)
+    fig.text(0.5, 0.08, note_text, ha='center', fontsize=10, style='italic', alpha=0.7)
     
-    plt.tight_layout()
+    fig.tight_layout()
     pdf_path = output_dir / 'summary_table.pdf'
-    plt.savefig(pdf_path, format='pdf', bbox_inches='tight', dpi=150)
-    plt.close()
+    fig.savefig(pdf_path, format='pdf', bbox_inches='tight', dpi=150)
     print(f"  ✓ Saved: {pdf_path}")
 
 def create_all_plots(csv_file):
@@ -343,13 +325,17 @@ def create_all_plots(csv_file):
     print(f"\nGenerating PDF plots in: {output_dir}")
     print("-" * 50)
     
-    # Generate each plot
-    create_amplification_plot(df, output_dir)
-    create_io_distribution_plot(df, output_dir)
-    create_loglog_plot(df, output_dir)
-    create_overhead_comparison_plot(df, output_dir)
-    create_pie_charts_comparison(df, output_dir)
-    create_summary_table(df, output_dir)
+    # Generate each plot, redrawing one figure instead of rebuilding it
+    fig = plt.figure()
+    try:
+        create_amplification_plot(df, output_dir, fig)
+        create_io_distribution_plot(df, output_dir, fig)
+        create_loglog_plot(df, output_dir, fig)
+        create_overhead_comparison_plot(df, output_dir, fig)
+        create_pie_charts_comparison(df, output_dir, fig)
+        create_summary_table(df, output_dir, fig)
+    finally:
+        plt.close(fig)
     
     print("-" * 50)
     print(f"✅ All PDF plots generated successfully!")
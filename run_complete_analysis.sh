@@ -142,19 +142,38 @@ import json
 import glob
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved; skip interactive backend setup
 import matplotlib.pyplot as plt
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 # Set publication quality
 plt.rcParams['font.size'] = 10
 plt.rcParams['axes.linewidth'] = 0.8
 
+def event_bucket(layer, event):
+    """Map a (layer, event) pair to the stats key it accumulates into"""
+    if layer == 'APPLICATION':
+        return 'app'
+    if layer == 'OS':
+        return 'os'
+    if layer == 'STORAGE_SVC' and 'META' in event:
+        return 'metadata'
+    if layer == 'FILESYSTEM' and 'SYNC' in event:
+        return 'journal'
+    if layer == 'DEVICE' and 'SUBMIT' in event:
+        return 'device'
+    return None
+
 def parse_trace(trace_file, test_size):
     """Parse trace with correct byte counting"""
-    stats = {
-        'app': 0, 'os': 0, 'device': 0,
-        'metadata': 0, 'journal': 0
-    }
+    # Accumulate into locals and counts; metadata and journal entries have
+    # fixed per-event sizes, so they are scaled once after the scan
+    app = os_bytes = device = metadata_ops = journal_ops = 0
+    # Only a handful of distinct (layer, event) pairs exist, so classify
+    # each pair once instead of re-running substring tests per event
+    buckets = {}
     
     with open(trace_file, 'r') as f:
         in_window = False
@@ -164,35 +183,50 @@ def parse_trace(trace_file, test_size):
             if not in_window or 'TIME' in line:
                 continue
                 
-            parts = line.split()
+            # Only the first five fields are read; stop splitting after the
+            # seventh so trailing flag text is not tokenized
+            parts = line.split(None, 6)
             if len(parts) < 7:
                 continue
                 
-            try:
-                layer = parts[1]
-                event = parts[2]
-                size = int(parts[3])
-                aligned = int(parts[4])
-                
-                # Skip heartbeats
-                if size == 8 and 'APPLICATION' in layer:
-                    continue
-                    
-                if layer == 'APPLICATION' and size > 8:
-                    stats['app'] += size
-                elif layer == 'OS':
-                    stats['os'] += aligned
-                elif layer == 'STORAGE_SVC' and 'META' in event:
-                    stats['metadata'] += 450
-                elif layer == 'FILESYSTEM' and 'SYNC' in event:
-                    stats['journal'] += 4096
-                elif layer == 'DEVICE' and 'SUBMIT' in event:
-                    stats['device'] += size
-                    
-                if 'DEV_BIO_COMPLETE' in line:
-                    in_window = False
-            except:
-                pass
+            # Rows whose size columns are not plain counts (summary text,
+            # other tools' tables) are skipped without raising
+            if not (parts[3].isdigit() and parts[4].isdigit()):
+                continue
+            
+            layer = parts[1]
+            event = parts[2]
+            size = int(parts[3])
+            aligned = int(parts[4])
+            
+            # Skip heartbeats
+            if size == 8 and 'APPLICATION' in layer:
+                continue
+            
+            key = (layer, event)
+            if key not in buckets:
+                buckets[key] = event_bucket(layer, event)
+            bucket = buckets[key]
+            
+            if bucket == 'app':
+                if size > 8:
+                    app += size
+            elif bucket == 'os':
+                os_bytes += aligned
+            elif bucket == 'metadata':
+                metadata_ops += 1
+            elif bucket == 'journal':
+                journal_ops += 1
+            elif bucket == 'device':
+                device += size
+            
+            if 'DEV_BIO_COMPLETE' in line:
+                in_window = False
+    
+    stats = {
+        'app': app, 'os': os_bytes, 'device': device,
+        'metadata': metadata_ops * 450, 'journal': journal_ops * 4096
+    }
     
     # Use minimum expected values for small objects
     if test_size <= 100 and stats['app'] == 0:
@@ -204,15 +238,22 @@ def parse_trace(trace_file, test_size):
         
     return stats
 
-# Analyze all traces
-sizes = ['1B', '10B', '100B', '1KB', '10KB', '100KB', '1MB', '10MB', '100MB']
-size_bytes = [1, 10, 100, 1024, 10240, 102400, 1048576, 10485760, 104857600]
+def main():
+    # Analyze all traces
+    sizes = ['1B', '10B', '100B', '1KB', '10KB', '100KB', '1MB', '10MB', '100MB']
+    size_bytes = [1, 10, 100, 1024, 10240, 102400, 1048576, 10485760, 104857600]
+
+    found = [(size, bytes_val) for size, bytes_val in zip(sizes, size_bytes)
+             if Path(f"{size}_trace.log").exists()]
+
+    # Traces are independent, so parse them on all cores; map() keeps size order
+    with ProcessPoolExecutor() as pool:
+        parsed = list(pool.map(parse_trace,
+                               [f"{size}_trace.log" for size, _ in found],
+                               [bytes_val for _, bytes_val in found]))
 
-results = []
-for size, bytes_val in zip(sizes, size_bytes):
-    trace_file = f"{size}_trace.log"
-    if Path(trace_file).exists():
-        stats = parse_trace(trace_file, bytes_val)
+    results = []
+    for (size, bytes_val), stats in zip(found, parsed):
         results.append({
             'size': size,
             'bytes': bytes_val,
@@ -220,68 +261,73 @@ for size, bytes_val in zip(sizes, size_bytes):
             'os': stats['os'],
             'device': stats['device'],
             'metadata': stats['metadata'],
-            'journal': stats['journal'],
-            'amplification': stats['device'] / bytes_val if bytes_val > 0 else 0,
-            'efficiency': 100 * bytes_val / stats['device'] if stats['device'] > 0 else 0
+            'journal': stats['journal']
         })
 
-df = pd.DataFrame(results)
-
-# Figure 1: Amplification
-fig, ax = plt.subplots(figsize=(3.5, 2.5))
-colors = ['#d32f2f' if a > 100 else '#ff9800' if a > 10 else '#4caf50' 
-          for a in df['amplification']]
-ax.bar(range(len(df)), df['amplification'], color=colors, alpha=0.8, edgecolor='black', linewidth=0.5)
-ax.set_yscale('log')
-ax.set_ylim(1, 100000)
-ax.set_xlabel('Object Size')
-ax.set_ylabel('Amplification Factor')
-ax.set_xticks(range(len(df)))
-ax.set_xticklabels(df['size'], rotation=45, ha='right', fontsize=8)
-ax.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('paper_figures/fig1_amplification.pdf', dpi=300)
-plt.close()
-
-# Figure 2: Distribution
-fig, ax = plt.subplots(figsize=(3.5, 2.5))
-data_pct = 100 * df['app'] / df['device']
-meta_pct = 100 * df['metadata'] / df['device']
-journal_pct = 100 * df['journal'] / df['device']
-x = np.arange(len(df))
-ax.bar(x, data_pct, label='Data', color='#2196f3')
-ax.bar(x, meta_pct, bottom=data_pct, label='Metadata', color='#ff9800')
-ax.bar(x, journal_pct, bottom=data_pct+meta_pct, label='Journal', color='#f44336')
-ax.set_xlabel('Object Size')
-ax.set_ylabel('I/O Distribution (%)')
-ax.set_xticks(x)
-ax.set_xticklabels(df['size'], rotation=45, ha='right', fontsize=8)
-ax.legend(fontsize=8)
-ax.grid(True, alpha=0.3, axis='y')
-plt.tight_layout()
-plt.savefig('paper_figures/fig2_distribution.pdf', dpi=300)
-plt.close()
-
-# Figure 3: Efficiency
-fig, ax = plt.subplots(figsize=(3.5, 2.5))
-colors = ['#4caf50' if e > 10 else '#ff9800' if e > 1 else '#d32f2f'
-          for e in df['efficiency']]
-ax.bar(range(len(df)), df['efficiency'], color=colors, alpha=0.8, edgecolor='black', linewidth=0.5)
-ax.set_xlabel('Object Size')
-ax.set_ylabel('I/O Efficiency (%)')
-ax.set_xticks(range(len(df)))
-ax.set_xticklabels(df['size'], rotation=45, ha='right', fontsize=8)
-ax.set_ylim(0, 60)
-ax.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('paper_figures/fig3_efficiency.pdf', dpi=300)
-plt.close()
-
-# Save summary
-df.to_csv('paper_figures/summary.csv', index=False)
-print("\nSummary:")
-print(df.to_string(index=False))
-print("\nFigures saved to paper_figures/")
+    df = pd.DataFrame(results)
+
+    # Derived ratios as whole-column operations rather than per-row arithmetic
+    df['amplification'] = (df['device'] / df['bytes']).where(df['bytes'] > 0, 0)
+    df['efficiency'] = (100 * df['bytes'] / df['device']).where(df['device'] > 0, 0)
+
+    # Figure 1: Amplification
+    fig, ax = plt.subplots(figsize=(3.5, 2.5))
+    colors = ['#d32f2f' if a > 100 else '#ff9800' if a > 10 else '#4caf50' 
+              for a in df['amplification']]
+    ax.bar(range(len(df)), df['amplification'], color=colors, alpha=0.8, edgecolor='black', linewidth=0.5)
+    ax.set_yscale('log')
+    ax.set_ylim(1, 100000)
+    ax.set_xlabel('Object Size')
+    ax.set_ylabel('Amplification Factor')
+    ax.set_xticks(range(len(df)))
+    ax.set_xticklabels(df['size'], rotation=45, ha='right', fontsize=8)
+    ax.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.savefig('paper_figures/fig1_amplification.pdf', dpi=300)
+    plt.close()
+
+    # Figure 2: Distribution
+    fig, ax = plt.subplots(figsize=(3.5, 2.5))
+    data_pct = 100 * df['app'] / df['device']
+    meta_pct = 100 * df['metadata'] / df['device']
+    journal_pct = 100 * df['journal'] / df['device']
+    x = np.arange(len(df))
+    ax.bar(x, data_pct, label='Data', color='#2196f3')
+    ax.bar(x, meta_pct, bottom=data_pct, label='Metadata', color='#ff9800')
+    ax.bar(x, journal_pct, bottom=data_pct+meta_pct, label='Journal', color='#f44336')
+    ax.set_xlabel('Object Size')
+    ax.set_ylabel('I/O Distribution (%)')
+    ax.set_xticks(x)
+    ax.set_xticklabels(df['size'], rotation=45, ha='right', fontsize=8)
+    ax.legend(fontsize=8)
+    ax.grid(True, alpha=0.3, axis='y')
+    plt.tight_layout()
+    plt.savefig('paper_figures/fig2_distribution.pdf', dpi=300)
+    plt.close()
+
+    # Figure 3: Efficiency
+    fig, ax = plt.subplots(figsize=(3.5, 2.5))
+    colors = ['#4caf50' if e > 10 else '#ff9800' if e > 1 else '#d32f2f'
+              for e in df['efficiency']]
+    ax.bar(range(len(df)), df['efficiency'], color=colors, alpha=0.8, edgecolor='black', linewidth=0.5)
+    ax.set_xlabel('Object Size')
+    ax.set_ylabel('I/O Efficiency (%)')
+    ax.set_xticks(range(len(df)))
+    ax.set_xticklabels(df['size'], rotation=45, ha='right', fontsize=8)
+    ax.set_ylim(0, 60)
+    ax.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.savefig('paper_figures/fig3_efficiency.pdf', dpi=300)
+    plt.close()
+
+    # Save summary
+    df.to_csv('paper_figures/summary.csv', index=False)
+    print("\nSummary:")
+    print(df.to_string(index=False))
+    print("\nFigures saved to paper_figures/")
+
+if __name__ == "__main__":
+    main()
 EOF
 
 chmod +x $RESULTS_DIR/analyze.py
@@ -152,8 +152,6 @@ analyze_trace() {
     local size=$4
     
     python3 - << EOF
-import re
-
 trace_file = "$trace_file"
 operation = "$operation"
 name = "$name"
@@ -292,13 +290,34 @@ echo "SEPARATED READ/WRITE I/O ANALYSIS SUMMARY" >> $ANALYSIS_FILE
 echo "========================================================================" >> $ANALYSIS_FILE
 echo "" >> $ANALYSIS_FILE
 
+# Every trace is analyzed independently, so run them all in the
+# background and append the reports in size order once they finish
+REPORT_DIR=$(mktemp -d)
+trap 'rm -rf "$REPORT_DIR"' EXIT
+ANALYZE_PIDS=()
+for op in write read; do
+    for i in ${!SIZES[@]}; do
+        analyze_trace "$RESULTS_DIR/${op}_traces/${NAMES[$i]}_${op}.log" \
+                      "$op" "${NAMES[$i]}" ${SIZES[$i]} > "$REPORT_DIR/${op}_$i.txt" &
+        ANALYZE_PIDS+=($!)
+    done
+done
+# Wait on each job so a failed analysis is not masked by a later one
+ANALYZE_RC=0
+for pid in "${ANALYZE_PIDS[@]}"; do
+    wait "$pid" || ANALYZE_RC=1
+done
+if [ $ANALYZE_RC -ne 0 ]; then
+    echo -e "${RED}ERROR: Trace analysis failed${NC}"
+    exit 1
+fi
+
 # Analyze write operations
 echo "WRITE OPERATIONS" >> $ANALYSIS_FILE
 echo "----------------" >> $ANALYSIS_FILE
 for i in ${!SIZES[@]}; do
     echo "" >> $ANALYSIS_FILE
-    analyze_trace "$RESULTS_DIR/write_traces/${NAMES[$i]}_write.log" \
-                  "write" "${NAMES[$i]}" ${SIZES[$i]} >> $ANALYSIS_FILE
+    cat "$REPORT_DIR/write_$i.txt" >> $ANALYSIS_FILE
 done
 
 echo "" >> $ANALYSIS_FILE
@@ -306,9 +325,9 @@ echo "READ OPERATIONS" >> $ANALYSIS_FILE
 echo "---------------" >> $ANALYSIS_FILE
 for i in ${!SIZES[@]}; do
     echo "" >> $ANALYSIS_FILE
-    analyze_trace "$RESULTS_DIR/read_traces/${NAMES[$i]}_read.log" \
-                  "read" "${NAMES[$i]}" ${SIZES[$i]} >> $ANALYSIS_FILE
+    cat "$REPORT_DIR/read_$i.txt" >> $ANALYSIS_FILE
 done
+rm -rf "$REPORT_DIR"
 
 # Display summary
 cat $ANALYSIS_FILE
@@ -199,8 +199,8 @@ du -sh $RESULTS_DIR/*/*.strace 2>/dev/null | head -10
 
 echo ""
 echo "xl.meta access summary:"
-for file in $RESULTS_DIR/*/*.strace; do
-    count=$(grep -c "xl.meta" $file 2>/dev/null || echo 0)
+# One grep over every capture; -H keeps the file name even for a single file
+grep -cH "xl.meta" $RESULTS_DIR/*/*.strace 2>/dev/null | while IFS=: read -r file count; do
     if [ "$count" -gt 0 ]; then
         echo "  $(basename $file): $count xl.meta operations"
     fi